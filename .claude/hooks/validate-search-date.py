@@ -2,81 +2,123 @@
 """
 PreToolUse hook for WebSearch date validation.
 Ensures search queries account for current date context (2025).
+
+Only sys is imported up front: calls for unrelated tools are answered before
+the JSON, regex and datetime modules are ever loaded.
 """
 
-import json
-import re
 import sys
-from datetime import datetime
+
+# Tools this hook validates
+VALIDATED_TOOLS = frozenset({"WebSearch", "WebFetch"})
+
+# Pre-serialized no-op response for the common "nothing to report" path
+CONTINUE_RESPONSE = b'{"continue": true}\n'
+
+# Keywords signalling explicit historical intent
+HISTORICAL_KEYWORDS = [
+    "history", "changelog", "release", "version", "archive",
+    "legacy", "migration", "deprecated", "old", "previous",
+    "comparison", "vs", "versus", "difference", "evolution",
+    "retrospective", "review", "what happened", "timeline",
+    "older", "past", "former", "earlier"
+]
+
+# Keywords signalling the user wants current information
+TIME_SENSITIVE_KEYWORDS = [
+    "latest", "current", "recent", "new", "update", "modern",
+    "documentation", "docs", "guide", "tutorial", "best practices"
+]
+
+def compile_query_pattern():
+    """
+    Compile every query signal into one case-insensitive pattern, so a query is
+    scanned once: old years (2020-2024), current/future years (2025+) and both
+    keyword lists. The named group tells which signal matched; the lookahead
+    tries every position, so overlapping signals are all found. Each hook
+    process checks a single query, so this runs at most once.
+    """
+    import re
+    
+    return re.compile(
+        r'(?=(?P<old_year>\b202[0-4]\b)'
+        r'|(?P<current_year>\b202[5-9]\b)'
+        '|(?P<historical>' + '|'.join(map(re.escape, HISTORICAL_KEYWORDS)) + ')'
+        '|(?P<time_sensitive>' + '|'.join(map(re.escape, TIME_SENSITIVE_KEYWORDS)) + '))',
+        re.IGNORECASE
+    )
 
 def main():
     try:
-        # Read the tool call JSON from stdin
-        tool_call = json.load(sys.stdin)
+        # Read the raw tool call JSON from stdin
+        buf = sys.stdin.buffer.read()
+        
+        # Cheap prefilter: skip JSON decoding entirely for unrelated tools
+        if b'"WebSearch"' not in buf and b'"WebFetch"' not in buf:
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
+            return
+        
+        # Relevant call: only now load the JSON codec
+        import json
+        
+        tool_call = json.loads(buf)
         
         # Extract tool name and parameters
         tool_name = tool_call.get("name", "")
         parameters = tool_call.get("parameters", {})
         
         # Only validate WebSearch and WebFetch tools
-        if tool_name not in ["WebSearch", "WebFetch"]:
-            print(json.dumps({"continue": True}))
+        if tool_name not in VALIDATED_TOOLS:
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
             return
         
         # Get the search query
         query = parameters.get("query", "")
         if not query:
-            print(json.dumps({"continue": True}))
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
             return
         
+        from datetime import datetime
+        
         # Current year for validation
         current_year = datetime.now().year
         
-        # Check for historical intent keywords
-        historical_keywords = [
-            "history", "changelog", "release", "version", "archive", 
-            "legacy", "migration", "deprecated", "old", "previous",
-            "comparison", "vs", "versus", "difference", "evolution",
-            "retrospective", "review", "what happened", "timeline",
-            "older", "past", "former", "earlier"
-        ]
+        # Classify years and keywords in a single pass over the query
+        mentioned_old_years = set()
+        query_signals = set()
+        for match in compile_query_pattern().finditer(query):
+            signal = match.lastgroup
+            if signal == "old_year":
+                mentioned_old_years.add(match.group("old_year"))
+            else:
+                query_signals.add(signal)
         
         # Check for explicit historical intent
-        explicit_historical = any(keyword in query.lower() for keyword in historical_keywords)
-        
-        # Check if query already has old years (2020-2024)
-        old_year_pattern = r'\b(202[0-4])\b'
-        mentioned_old_years = re.findall(old_year_pattern, query)
+        explicit_historical = "historical" in query_signals
         
         # Check if query already has current/future years (2025+)
-        current_year_pattern = r'\b(202[5-9])\b'
-        has_current_year = bool(re.search(current_year_pattern, query))
+        has_current_year = "current_year" in query_signals
         
         # If historical intent with old years, allow as-is
         if explicit_historical and mentioned_old_years:
             response = {
                 "continue": True,
-                "message": f"ℹ️  Historical search detected for {', '.join(set(mentioned_old_years))} - preserving original query"
+                "message": f"ℹ️  Historical search detected for {', '.join(mentioned_old_years)} - preserving original query"
             }
-            print(json.dumps(response))
+            sys.stdout.buffer.write(json.dumps(response).encode() + b"\n")
             return
         
         # If old years without historical intent, suggest current context
         if mentioned_old_years and not explicit_historical:
             response = {
                 "decision": "continue",
-                "message": f"⚠️  Query mentions {', '.join(set(mentioned_old_years))} but current year is {current_year}. Add 'historical' if you want old info, otherwise search will default to current context."
+                "message": f"⚠️  Query mentions {', '.join(mentioned_old_years)} but current year is {current_year}. Add 'historical' if you want old info, otherwise search will default to current context."
             }
-            print(json.dumps(response))
+            sys.stdout.buffer.write(json.dumps(response).encode() + b"\n")
             return
         
         # For queries without year context, suggest adding current year
-        time_sensitive_keywords = [
-            "latest", "current", "recent", "new", "update", "modern", 
-            "documentation", "docs", "guide", "tutorial", "best practices"
-        ]
-        
-        has_time_sensitive = any(keyword in query.lower() for keyword in time_sensitive_keywords)
+        has_time_sensitive = "time_sensitive" in query_signals
         
         if (has_time_sensitive or not has_current_year) and not explicit_historical:
             # Suggest modified query with current year
@@ -85,19 +127,20 @@ def main():
                 "decision": "continue",
                 "message": f"💡 Auto-suggesting current context: Consider searching '{modified_query}' for {current_year} results"
             }
-            print(json.dumps(response))
+            sys.stdout.buffer.write(json.dumps(response).encode() + b"\n")
             return
         
         # Allow the search to continue
-        print(json.dumps({"continue": True}))
+        sys.stdout.buffer.write(CONTINUE_RESPONSE)
         
     except Exception as e:
         # On error, allow the search but log the issue
+        import json
         response = {
             "continue": True,
             "message": f"Date validation hook error: {str(e)}"
         }
-        print(json.dumps(response))
+        sys.stdout.buffer.write(json.dumps(response).encode() + b"\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,17 +2,160 @@
 """
 PostToolUse hook for WebSearch result validation.
 Analyzes search results to warn about potentially outdated information.
+
+Only sys is imported up front: calls for unrelated tools are answered before
+the JSON, regex and datetime modules are ever loaded.
+
+Results of up to 2 * SCAN_CAP characters, counted across all of the result's
+text leaves, are scanned whole. Larger ones (e.g. full pages from WebFetch,
+or searches with many entries) are only scanned in a head and tail window of
+SCAN_CAP characters each. Dates usually sit in headers, footers and bylines,
+so this bounds the hook's latency at the cost of missing signals buried in
+the middle of a huge result. The cuts between the windows can also both miss
+a match that straddles them and create a false one (e.g. a \b boundary
+matching at a cut inside " 20235 ").
 """
 
-import json
-import re
 import sys
-from datetime import datetime
+
+# Tools this hook validates
+VALIDATED_TOOLS = frozenset({"WebSearch", "WebFetch"})
+
+# Pre-serialized no-op response for the common "nothing to report" path
+CONTINUE_RESPONSE = b'{"continue": true}\n'
+
+# Characters scanned from each end of an oversized result, across all its text leaves
+SCAN_CAP = 262144
+
+def compile_patterns(current_year):
+    """
+    Compile the result scan patterns. Each hook process scans a single result,
+    so this runs at most once and only when a result actually needs checking.
+    Returns (old_year_pattern, old_date_patterns, current_year_pattern, recent_indicator_pattern).
+    """
+    import re
+    
+    old_year_pattern = re.compile(r'\b(202[0-4])\b')
+    # Date-related patterns that might indicate old content. Kept as separate
+    # scans: each has a literal prefix re can skip ahead on, which benchmarks
+    # faster than a single fused alternation.
+    old_date_patterns = [
+        re.compile(r'updated.*202[0-4]', re.IGNORECASE),
+        re.compile(r'published.*202[0-4]', re.IGNORECASE),
+        re.compile(r'last.*modified.*202[0-4]', re.IGNORECASE),
+        re.compile(r'copyright.*202[0-4]', re.IGNORECASE)
+    ]
+    current_year_pattern = re.compile(rf'\b{current_year}\b')
+    recent_indicator_pattern = re.compile(r'\b(latest|current|recent|new|updated)\b', re.IGNORECASE)
+    
+    return old_year_pattern, old_date_patterns, current_year_pattern, recent_indicator_pattern
+
+def iter_result_texts(result):
+    """
+    Yield the text leaves (strings and numbers) of a decoded result, so keys
+    and repr punctuation are never scanned. Booleans are skipped.
+    """
+    if isinstance(result, str):
+        yield result
+    elif isinstance(result, dict):
+        for value in result.values():
+            yield from iter_result_texts(value)
+    elif isinstance(result, list):
+        for item in result:
+            yield from iter_result_texts(item)
+    elif isinstance(result, (int, float)) and not isinstance(result, bool):
+        yield str(result)
+
+def iter_scan_windows(texts):
+    """
+    Yield the parts of texts that should be scanned. Texts totalling at most
+    2 * SCAN_CAP characters are yielded unsplit. Beyond that, yield the first
+    SCAN_CAP characters across all texts, then the last SCAN_CAP characters of
+    the rest. Only the tail window is held back, so the total scanned stays
+    within 2 * SCAN_CAP however many leaves a result has.
+    """
+    from collections import deque
+    from itertools import chain
+    
+    # Buffer texts until they outgrow both windows; if they never do, there
+    # is nothing to cut
+    texts = iter(texts)
+    pending = []
+    pending_size = 0
+    for text in texts:
+        pending.append(text)
+        pending_size += len(text)
+        if pending_size > 2 * SCAN_CAP:
+            break
+    else:
+        yield from pending
+        return
+    
+    head_budget = SCAN_CAP
+    tail = deque()
+    tail_size = 0
+    
+    for text in chain(pending, texts):
+        if head_budget:
+            if len(text) <= head_budget:
+                head_budget -= len(text)
+                yield text
+                continue
+            yield text[:head_budget]
+            text = text[head_budget:]
+            head_budget = 0
+        
+        tail.append(text)
+        tail_size += len(text)
+        # Drop whole texts that have fallen out of the tail window
+        while tail_size - len(tail[0]) >= SCAN_CAP:
+            tail_size -= len(tail.popleft())
+    
+    if tail_size > SCAN_CAP:
+        tail[0] = tail[0][tail_size - SCAN_CAP:]
+    yield from tail
+
+def scan_texts(texts, patterns):
+    """
+    Scan text chunks for date signals, keeping only aggregate findings.
+    Returns (outdated_years, old_date_count, has_current_year, has_recent_indicators),
+    with outdated_years as a set of unique year strings.
+    """
+    old_year_pattern, old_date_patterns, current_year_pattern, recent_indicator_pattern = patterns
+    outdated_years = set()
+    old_date_count = 0
+    has_current_year = False
+    has_recent_indicators = False
+    
+    for text in iter_scan_windows(texts):
+        # Check for outdated year mentions in results
+        for match in old_year_pattern.finditer(text):
+            outdated_years.add(match.group(1))
+        
+        # Check for date-related patterns that might indicate old content
+        for pattern in old_date_patterns:
+            old_date_count += len(pattern.findall(text))
+        
+        # Check if results seem to lack recent information
+        has_current_year = has_current_year or bool(current_year_pattern.search(text))
+        has_recent_indicators = has_recent_indicators or bool(recent_indicator_pattern.search(text))
+    
+    return outdated_years, old_date_count, has_current_year, has_recent_indicators
 
 def main():
     try:
-        # Read the tool execution result from stdin
-        tool_result = json.load(sys.stdin)
+        # Read the raw tool execution result from stdin
+        buf = sys.stdin.buffer.read()
+        
+        # Cheap prefilter: skip JSON decoding entirely for unrelated tools
+        if b'"WebSearch"' not in buf and b'"WebFetch"' not in buf:
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
+            return
+        
+        # Possibly relevant call: only now load the JSON machinery
+        import json
+        
+        tool_result = json.loads(buf)
         
         # Extract tool name and result
         tool_name = tool_result.get("name", "")
@@ -20,50 +163,32 @@ def main():
         error = tool_result.get("error", "")
         
         # Only validate WebSearch and WebFetch tools
-        if tool_name not in ["WebSearch", "WebFetch"]:
-            print(json.dumps({"continue": True}))
+        if tool_name not in VALIDATED_TOOLS:
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
             return
         
         # Skip if there was an error
         if error:
-            print(json.dumps({"continue": True}))
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
             return
         
-        # Convert result to string for analysis
-        result_text = str(result)
+        # Result needs checking: only now load the date and regex machinery
+        from datetime import datetime
         
         current_year = datetime.now().year
+        patterns = compile_patterns(current_year)
         
-        # Check for outdated year mentions in results
-        year_pattern = r'\b(202[0-4])\b'
-        outdated_years = re.findall(year_pattern, result_text)
-        
-        # Check for date-related patterns that might indicate old content
-        old_date_patterns = [
-            r'updated.*202[0-4]',
-            r'published.*202[0-4]',
-            r'last.*modified.*202[0-4]',
-            r'copyright.*202[0-4]'
-        ]
-        
-        old_dates_found = []
-        for pattern in old_date_patterns:
-            matches = re.findall(pattern, result_text, re.IGNORECASE)
-            old_dates_found.extend(matches)
+        # Scan each text leaf of the result rather than its str() rendering
+        outdated_years, old_date_count, has_current_year, has_recent_indicators = scan_texts(iter_result_texts(result), patterns)
         
         # Generate warnings based on findings
         warnings = []
         
         if outdated_years:
-            unique_years = sorted(set(outdated_years))
-            warnings.append(f"Search results contain references to {', '.join(unique_years)}. Current year is {current_year}.")
-        
-        if old_dates_found:
-            warnings.append(f"Found {len(old_dates_found)} potentially outdated timestamps in results.")
+            warnings.append(f"Search results contain references to {', '.join(sorted(outdated_years))}. Current year is {current_year}.")
         
-        # Check if results seem to lack recent information
-        has_current_year = bool(re.search(rf'\b{current_year}\b', result_text))
-        has_recent_indicators = bool(re.search(r'\b(latest|current|recent|new|updated)\b', result_text, re.IGNORECASE))
+        if old_date_count:
+            warnings.append(f"Found {old_date_count} potentially outdated timestamps in results.")
         
         if not has_current_year and has_recent_indicators:
             warnings.append("Results claim to be 'recent' or 'latest' but don't mention current year.")
@@ -74,17 +199,18 @@ def main():
                 "continue": True,
                 "message": f"⚠️  Search Result Date Warning:\n" + "\n".join(f"• {w}" for w in warnings) + f"\n• Consider refining search with '{current_year}' for more current results"
             }
-            print(json.dumps(response))
+            sys.stdout.buffer.write(json.dumps(response).encode() + b"\n")
         else:
-            print(json.dumps({"continue": True}))
+            sys.stdout.buffer.write(CONTINUE_RESPONSE)
         
     except Exception as e:
         # On error, allow continuation but log the issue
+        import json
         response = {
             "continue": True,
             "message": f"Search result validation hook error: {str(e)}"
         }
-        print(json.dumps(response))
+        sys.stdout.buffer.write(json.dumps(response).encode() + b"\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -421,7 +421,7 @@ cat > .claude/settings.json << 'EOF'
         "hooks": [
           {
             "type": "command",
-            "command": "python3 .claude/hooks/validate-search-date.py"
+            "command": "python3 -S -I .claude/hooks/validate-search-date.py"
           }
         ]
       }
@@ -432,7 +432,7 @@ cat > .claude/settings.json << 'EOF'
         "hooks": [
           {
             "type": "command",
-            "command": "python3 .claude/hooks/validate-search-results.py"
+            "command": "python3 -S -I .claude/hooks/validate-search-results.py"
           }
         ]
       }
@@ -554,76 +554,28 @@ EOF
 fi
 
 
-# Create web search validation hooks
-cat > .claude/hooks/validate-search-date.py << 'EOF'
-#!/usr/bin/env python3
-"""
-PreToolUse Hook: Validate search queries for current date context
-Ensures web searches include current year (2025) when appropriate
-"""
-import sys
-import json
-import re
-from datetime import datetime
-
-def main():
-    if len(sys.argv) != 2:
-        sys.exit(0)
-    
-    tool_input = json.loads(sys.argv[1])
-    query = tool_input.get('query', '')
-    
-    current_year = datetime.now().year
-    
-    # Check for outdated year references
-    old_years = ['2020', '2021', '2022', '2023', '2024']
-    for year in old_years:
-        if year in query and str(current_year) not in query:
-            print(f"[WARN] Warning: Search query contains {year} but not {current_year}")
-            print(f"Consider adding '{current_year}' for current results")
-            break
-    
-    # Suggest adding current year for time-sensitive topics
-    time_sensitive = ['latest', 'new', 'recent', 'current', 'update', 'release']
-    if any(word in query.lower() for word in time_sensitive):
-        if str(current_year) not in query:
-            print(f"[TIP] Tip: Add '{current_year}' to get the most current results")
-
-if __name__ == '__main__':
-    main()
-EOF
-
-cat > .claude/hooks/validate-search-results.py << 'EOF'
+# Download web search validation hooks from repo
+# (single source of truth: no inline copies that can drift from the repo versions)
+for hook in validate-search-date.py validate-search-results.py; do
+    echo -n "  Installing ${hook} hook... "
+    if download_with_retry "https://raw.githubusercontent.com/orielsanchez/claude-code-template/main/.claude/hooks/${hook}" ".claude/hooks/${hook}"; then
+        echo "[OK]"
+    else
+        # Fallback: settings.json still runs this hook, so install a pass-through
+        # version rather than leave a missing file that would block every call
+        echo "[WARN] (download failed, creating pass-through version)"
+        cat > ".claude/hooks/${hook}" << 'EOF'
 #!/usr/bin/env python3
-"""
-PostToolUse Hook: Analyze search results for outdated information
-Warns about potentially stale search results
-"""
+"""Pass-through fallback: allows every call without date validation."""
 import sys
-import json
-import re
 
-def main():
-    if len(sys.argv) != 2:
-        sys.exit(0)
-    
-    result = sys.argv[1]
-    
-    # Look for outdated year references in results
-    old_years = ['2020', '2021', '2022', '2023', '2024']
-    for year in old_years:
-        if year in result:
-            print(f"[NOTICE] Notice: Search results contain references to {year}")
-            print("Consider refining search with current year for latest information")
-            break
-
-if __name__ == '__main__':
-    main()
+sys.stdout.write('{"continue": true}\n')
 EOF
+    fi
+done
 
 # Make Python hooks executable
-chmod +x .claude/hooks/validate-search-date.py
-chmod +x .claude/hooks/validate-search-results.py
+chmod +x .claude/hooks/validate-search-*.py 2>/dev/null || true
 
 # Install hook documentation and examples
 echo -n "  Installing hooks documentation... "